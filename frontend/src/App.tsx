@@ -1,4 +1,10 @@
-import React, { useCallback, useEffect, useRef, useState } from "react";
+import React, {
+  useCallback,
+  useEffect,
+  useMemo,
+  useRef,
+  useState,
+} from "react";
 import {
   Button,
   Textarea,
@@ -10,9 +16,11 @@ import {
 import Header from "./components/ui/Header";
 import { colors } from "./utils/colors";
 import ReactMarkdown from "react-markdown";
+import type { Components } from "react-markdown";
 import remarkGfm from "remark-gfm";
 import { Toaster, toaster } from "./components/ui/toaster";
 import { ActiveDb, loadActiveDb } from "./utils/dbToggle";
+import { fetchEventSource } from "@microsoft/fetch-event-source";
 
 interface ChatMessage {
   role: "user" | "agent";
@@ -20,6 +28,57 @@ interface ChatMessage {
   cypher?: string;
 }
 
+// Shared by the history bubbles and the streaming bubble
+const markdownComponents: Components = {
+  ul: (props) => (
+    <ul
+      style={{
+        margin: "0.5rem 0",
+        paddingLeft: "1.25rem",
+        listStyleType: "disc",
+      }}
+      {...props}
+    />
+  ),
+  ol: (props) => (
+    <ol
+      style={{
+        margin: "0.5rem 0",
+        paddingLeft: "1.25rem",
+        listStyleType: "decimal",
+      }}
+      {...props}
+    />
+  ),
+  li: (props) => <li style={{ margin: "0.15rem 0" }} {...props} />,
+  h3: (props) => (
+    <h3
+      style={{
+        fontWeight: "bold",
+        fontSize: "1.1rem",
+      }}
+      {...props}
+    />
+  ),
+};
+
+// Cleans up the LLM's Markdown so headings and lists render on their own lines
+function normalizeMarkdown(content: string) {
+  return (
+    content
+      // newline before '###' if it follows right after a sentence
+      .replace(/([.!?])\s*###\s*/g, "$1\n\n### ")
+      // H3 header ends with a dash: '### Title- ' → '### Title\n'
+      .replace(/(###\s.+?)-\s+/g, "$1\n")
+      // newline after sentence punctuation before a "-" (list item)
+      .replace(/([.!?])\s*###\s*/g, "$1\n\n### ")
+      .replace(/(\d+\.)\s*/g, "\n$1 ")
+
+      // collapse excessive line breaks
+      .replace(/\n{3,}/g, "\n\n")
+  );
+}
+
 export default function App() {
   const [userPrompt, setUserPrompt] = useState<string>("");
   const [chatHistory, setChatHistory] = useState<ChatMessage[]>([]);
@@ -59,39 +118,76 @@ export default function App() {
     setOutput("");
     setIsStreaming(true);
 
-    controllerRef.current = new AbortController();
+    const controller = new AbortController();
+    controllerRef.current = controller;
 
     // Add the user message to the chat history
     setChatHistory((prev) => [...prev, { role: "user", content: userPrompt }]);
 
     try {
-      const res = await fetch("http://localhost:4000/api/neo4j/query", {
+      // Stream the answer: "meta" carries the Cypher, plain messages carry
+      // Markdown deltas, "done"/"error" end the turn
+      let cypher: string | undefined;
+      let finished = false;
+
+      await fetchEventSource("http://localhost:4000/api/neo4j/query/stream", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({
           prompt: userPrompt,
           sessionId: sessionIdRef.current,
         }),
-        signal: controllerRef.current.signal,
-      });
+        signal: controller.signal,
+        // Keep the stream open in background tabs instead of re-POSTing
+        openWhenHidden: true,
+        onmessage(ev) {
+          if (!ev.data) return;
+          const data = JSON.parse(ev.data);
 
-      const data = await res.json();
+          if (ev.event === "meta") {
+            cypher = data.cypher;
+          } else if (ev.event === "done") {
+            finished = true;
+            const agentText =
+              bufferRef.current.trim() ||
+              "I could not generate an explanation from the result.";
+            setChatHistory((prev) => [
+              ...prev,
+              { role: "agent", content: agentText, cypher },
+            ]);
+          } else if (ev.event === "error") {
+            finished = true;
+            setChatHistory((prev) => [
+              ...prev,
+              { role: "agent", content: `Error: ${data.error}` },
+            ]);
+          } else if (typeof data.delta === "string") {
+            bufferRef.current += data.delta;
+            setOutput(bufferRef.current);
+          }
+        },
+        onerror(err) {
+          // Don't let the library retry (it would re-run the question)
+          throw err;
+        },
+      });
 
-      if (data.error) {
-        setChatHistory((prev) => [
-          ...prev,
-          { role: "agent", content: `Error: ${data.error}` },
-        ]);
-      } else {
-        // Backend now returns { answer, cypher, rows }
-        const agentText: string =
-          typeof data.answer === "string"
-            ? data.answer
-            : "I could not generate an explanation from the result.";
+      if (!finished && !controller.signal.aborted) {
+        throw new Error("Stream ended unexpectedly");
+      }
 
+      // Stopped mid-answer: keep what was shown (the backend keeps it as the
+      // session's last turn too). A DB switch clears controllerRef and skips this.
+      const partial = bufferRef.current.trim();
+      if (
+        !finished &&
+        controller.signal.aborted &&
+        controllerRef.current === controller &&
+        partial
+      ) {
         setChatHistory((prev) => [
           ...prev,
-          { role: "agent", content: agentText, cypher: data.cypher },
+          { role: "agent", content: `${partial}\n\n_(interrupted)_`, cypher },
         ]);
       }
     } catch (err: any) {
@@ -117,6 +213,12 @@ export default function App() {
     return () => controllerRef.current?.abort();
   }, []);
 
+  // Only re-normalize when the history changes, not on every keystroke
+  const normalizedContents = useMemo(
+    () => chatHistory.map((msg) => normalizeMarkdown(msg.content)),
+    [chatHistory]
+  );
+
   const textareaRef = useRef<HTMLTextAreaElement | null>(null);
 
   // Auto-resize textarea
@@ -159,7 +261,6 @@ export default function App() {
           </Heading>
         )}
         {chatHistory.map((msg, idx) => {
-          console.log("Rendering message:", msg);
           const baseStyle: React.CSSProperties = {
             width: "90%",
             marginBottom: "0.5rem",
@@ -169,17 +270,7 @@ export default function App() {
             wordWrap: "break-word",
           };
 
-          const normalized = msg.content
-            // newline before '###' if it follows right after a sentence
-            .replace(/([.!?])\s*###\s*/g, "$1\n\n### ")
-            // H3 header ends with a dash: '### Title- ' → '### Title\n'
-            .replace(/(###\s.+?)-\s+/g, "$1\n")
-            // newline after sentence punctuation before a "-" (list item)
-            .replace(/([.!?])\s*###\s*/g, "$1\n\n### ")
-            .replace(/(\d+\.)\s*/g, "\n$1 ")
-
-            // collapse excessive line breaks
-            .replace(/\n{3,}/g, "\n\n");
+          const normalized = normalizedContents[idx];
 
           if (msg.role === "user") {
             return (
@@ -202,40 +293,7 @@ export default function App() {
                 >
                   <ReactMarkdown
                     remarkPlugins={[remarkGfm]}
-                    components={{
-                      ul: (props) => (
-                        <ul
-                          style={{
-                            margin: "0.5rem 0",
-                            paddingLeft: "1.25rem",
-                            listStyleType: "disc",
-                          }}
-                          {...props}
-                        />
-                      ),
-                      ol: (props) => (
-                        <ol
-                          style={{
-                            margin: "0.5rem 0",
-                            paddingLeft: "1.25rem",
-                            listStyleType: "decimal",
-                          }}
-                          {...props}
-                        />
-                      ),
-                      li: (props) => (
-                        <li style={{ margin: "0.15rem 0" }} {...props} />
-                      ),
-                      h3: (props) => (
-                        <h3
-                          style={{
-                            fontWeight: "bold",
-                            fontSize: "1.1rem",
-                          }}
-                          {...props}
-                        />
-                      ),
-                    }}
+                    components={markdownComponents}
                   >
                     {normalized}
                   </ReactMarkdown>
@@ -263,40 +321,7 @@ export default function App() {
                 >
                   <ReactMarkdown
                     remarkPlugins={[remarkGfm]}
-                    components={{
-                      ul: (props) => (
-                        <ul
-                          style={{
-                            margin: "0.5rem 0",
-                            paddingLeft: "1.25rem",
-                            listStyleType: "disc",
-                          }}
-                          {...props}
-                        />
-                      ),
-                      ol: (props) => (
-                        <ol
-                          style={{
-                            margin: "0.5rem 0",
-                            paddingLeft: "1.25rem",
-                            listStyleType: "decimal",
-                          }}
-                          {...props}
-                        />
-                      ),
-                      li: (props) => (
-                        <li style={{ margin: "0.15rem 0" }} {...props} />
-                      ),
-                      h3: (props) => (
-                        <h3
-                          style={{
-                            fontWeight: "bold",
-                            fontSize: "1.1rem",
-                          }}
-                          {...props}
-                        />
-                      ),
-                    }}
+                    components={markdownComponents}
                   >
                     {normalized}
                   </ReactMarkdown>
@@ -356,7 +381,16 @@ export default function App() {
               borderRadius: "12px",
             }}
           >
-            {output ? output : <i>Thinking...</i>}
+            {output ? (
+              <ReactMarkdown
+                remarkPlugins={[remarkGfm]}
+                components={markdownComponents}
+              >
+                {normalizeMarkdown(output)}
+              </ReactMarkdown>
+            ) : (
+              <i>Thinking...</i>
+            )}
             <Button
               onClick={stopStream}
               disabled={!isStreaming}
@@ -1,5 +1,6 @@
 import { ensureNeo4jMcp, writeCypher } from "../neo4jMcpClient.js";
 import { ELEMENTS_CYPHER, RELS_CYPHER } from "./transpiler-cyphers.js";
+import { logger } from "../logger.js";
 
 function assertSafeXmlFilename(fileName: string) {
   // Prevent "../", absolute paths, weird chars
@@ -15,6 +16,32 @@ FOR (e:ArchiElement) REQUIRE e.id IS UNIQUE;
 `;
 }
 
+function cypherCreateFulltextIndex() {
+  return `
+CREATE FULLTEXT INDEX archi_element_text IF NOT EXISTS
+FOR (e:ArchiElement) ON EACH [e.name, e.documentation];
+`;
+}
+
+// The DDL is idempotent, so once per process is enough (not once per file)
+let importSchemaReady: Promise<void> | null = null;
+
+function ensureImportSchema() {
+  importSchemaReady ??= (async () => {
+    // constraints (optional but recommended)
+    await writeCypher(cypherCreateConstraints());
+
+    // fulltext index so name/documentation lookups don't scan every element
+    await writeCypher(cypherCreateFulltextIndex());
+  })().catch((err) => {
+    // let the next import retry
+    importSchemaReady = null;
+    throw err;
+  });
+
+  return importSchemaReady;
+}
+
 function cypherImportElements(fileUrl: string) {
   return ELEMENTS_CYPHER;
 }
@@ -23,16 +50,8 @@ function cypherImportRelationships(fileUrl: string) {
   return RELS_CYPHER;
 }
 
-function cypherValidationSummary() {
-  return `
-MATCH (e:ArchiElement) WITH count(e) AS nodes
-MATCH ()-[r]->() WITH nodes, count(r) AS rels
-RETURN nodes, rels;
-`;
-}
-
 export async function importArchiXmlFromNeo4jImportDir(fileName: string) {
-  console.log("Filename: ", fileName);
+  logger.debug("Filename: ", fileName);
   assertSafeXmlFilename(fileName);
 
   // write DB
@@ -40,21 +59,19 @@ export async function importArchiXmlFromNeo4jImportDir(fileName: string) {
 
   const fileUrl = `file:///data/${fileName}`; // Todo: Replace the local preconfigured file with the uploaded version
 
-  // 1) constraints (optional but recommended)
-  await writeCypher(cypherCreateConstraints());
+  // 1) constraints + fulltext index (first import only)
+  await ensureImportSchema();
 
   // 2) elements (✅ pass $file param)
   const elRes = await writeCypher(ELEMENTS_CYPHER, { file: fileUrl });
   const elementsImported =
     elRes?.[0]?.elementsImported ?? elRes?.elementsImported ?? null;
 
-  // 3) relationships (✅ pass $file param)
+  // 3) relationships (✅ pass $file param) + quick validation summary
   const relRes = await writeCypher(RELS_CYPHER, { file: fileUrl });
-  const relationshipsImported =
-    relRes?.[0]?.relationshipsImported ?? relRes?.relationshipsImported ?? null;
-
-  // 4) quick validation summary
-  const summary = await writeCypher(cypherValidationSummary());
+  const relRow = relRes?.[0] ?? relRes;
+  const relationshipsImported = relRow?.relationshipsImported ?? null;
+  const summary = [{ nodes: relRow?.nodes ?? null, rels: relRow?.rels ?? null }];
 
   return {
     fileName,
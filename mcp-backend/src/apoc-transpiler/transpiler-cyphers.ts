@@ -47,5 +47,9 @@ CALL apoc.merge.relationship(
   t,
   {}
 ) YIELD rel
-RETURN count(*) AS relationshipsImported;
+WITH count(*) AS relationshipsImported
+// validation summary in the same round-trip
+RETURN relationshipsImported,
+       COUNT { (:ArchiElement) } AS nodes,
+       COUNT { ()-->() } AS rels;
 `;
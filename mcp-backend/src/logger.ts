@@ -0,0 +1,43 @@
+// src/logger.ts
+
+type LogLevel = "debug" | "info" | "warn" | "error";
+
+const LEVELS: Record<LogLevel, number> = {
+  debug: 10,
+  info: 20,
+  warn: 30,
+  error: 40,
+};
+
+// DEBUG=true is a shortcut for LOG_LEVEL=debug and wins over LOG_LEVEL, so a
+// .env copied from env.example can be switched to debug with that one flag
+function thresholdFromEnv(): number {
+  if (process.env.DEBUG === "true") return LEVELS.debug;
+
+  const level = process.env.LOG_LEVEL?.toLowerCase() as LogLevel | undefined;
+  if (level && level in LEVELS) return LEVELS[level];
+  return LEVELS.info;
+}
+
+const threshold = thresholdFromEnv();
+
+/**
+ * Level-gated console logging. Check isDebugEnabled() before building
+ * expensive debug messages (e.g. JSON.stringify of large results).
+ */
+export const logger = {
+  isDebugEnabled: () => threshold <= LEVELS.debug,
+
+  debug: (...args: unknown[]) => {
+    if (threshold <= LEVELS.debug) console.debug(...args);
+  },
+  info: (...args: unknown[]) => {
+    if (threshold <= LEVELS.info) console.log(...args);
+  },
+  warn: (...args: unknown[]) => {
+    if (threshold <= LEVELS.warn) console.warn(...args);
+  },
+  error: (...args: unknown[]) => {
+    if (threshold <= LEVELS.error) console.error(...args);
+  },
+};
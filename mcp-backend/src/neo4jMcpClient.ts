@@ -2,6 +2,7 @@
 import { Client } from "@modelcontextprotocol/sdk/client/index.js";
 import { StdioClientTransport } from "@modelcontextprotocol/sdk/client/stdio.js";
 import { CallToolResultSchema } from "@modelcontextprotocol/sdk/types.js";
+import { logger } from "./logger.js";
 
 const NEO4J_ENV_SPEEDPARCEL: Record<string, string> = {
   NEO4J_URI: process.env.LOCAL_SPEEDPARCEL_NEO4J_URI!,
@@ -21,16 +22,23 @@ const NEO4J_ENV_PLAYGROUND: Record<string, string> = {
   NEO4J_TELEMETRY: "false",
 };
 
-type DbTarget = "speedparcel" | "playground";
+export type DbTarget = "speedparcel" | "playground";
+
+type Connection = {
+  transport: StdioClientTransport;
+  client: Client;
+};
+
+// One live MCP connection per database, so toggling does not respawn neo4j-mcp
+const connections = new Map<DbTarget, Connection>();
 
-let transport: StdioClientTransport | null = null;
 let client: Client | null = null;
 
 // Track what we're currently connected to
 let currentTarget: DbTarget | null = null;
 
-// Prevent race conditions when multiple calls try to (re)connect at once
-let initPromise: Promise<void> | null = null;
+// Prevent race conditions when multiple calls try to connect the same DB at once
+const initPromises = new Map<DbTarget, Promise<Connection>>();
 
 function targetFromFlag(useSpeedparcel: boolean): DbTarget {
   return useSpeedparcel ? "speedparcel" : "playground";
@@ -42,11 +50,8 @@ function envForTarget(target: DbTarget): Record<string, string> {
     : NEO4J_ENV_PLAYGROUND;
 }
 
-async function connectToTarget(target: DbTarget) {
-  // Always start from a clean state
-  await shutdownNeo4jMcp();
-
-  transport = new StdioClientTransport({
+async function connectToTarget(target: DbTarget): Promise<Connection> {
+  const transport = new StdioClientTransport({
     command: "neo4j-mcp",
     args: [],
     env: {
@@ -55,20 +60,60 @@ async function connectToTarget(target: DbTarget) {
     },
   });
 
-  client = new Client({
+  const mcpClient = new Client({
     name: "neo4j-mcp-client-node",
     version: "1.0.0",
   });
 
-  await client.connect(transport);
-  currentTarget = target;
+  await mcpClient.connect(transport);
+
+  const connection = { transport, client: mcpClient };
+  connections.set(target, connection);
+
+  // Forget the connection if the child process goes away. currentTarget is
+  // kept, so the next read/write reconnects to the DB the user selected.
+  mcpClient.onclose = () => {
+    if (connections.get(target) !== connection) return;
+    connections.delete(target);
+    if (client === mcpClient) client = null;
+  };
 
-  console.log(`[MCP] Connected to Neo4j MCP server (${target})`);
+  logger.info(`[MCP] Connected to Neo4j MCP server (${target})`);
+  return connection;
+}
+
+async function getConnection(target: DbTarget): Promise<Connection> {
+  const existing = connections.get(target);
+  if (existing) return existing;
+
+  // Start connecting; store promise so concurrent callers coalesce
+  let pending = initPromises.get(target);
+  if (!pending) {
+    logger.info(`[MCP] Initializing DB connection: ${target}`);
+    pending = connectToTarget(target);
+    initPromises.set(target, pending);
+  }
+
+  try {
+    return await pending;
+  } finally {
+    if (initPromises.get(target) === pending) {
+      initPromises.delete(target);
+    }
+  }
+}
+
+/**
+ * Open a connection to a database without making it the active one,
+ * so a later switch to it doesn't pay the neo4j-mcp startup.
+ */
+export async function preconnectNeo4jMcp(useSpeedparcel: boolean) {
+  await getConnection(targetFromFlag(useSpeedparcel));
 }
 
 /**
  * Ensure we're connected to the requested database. If already connected to that DB, do nothing.
- * If connected to the other DB, reconnect.
+ * Connections to the other DB are kept open, so switching back is just a pointer swap.
  */
 export async function ensureNeo4jMcp(useSpeedparcel: boolean = false) {
   const desiredTarget = targetFromFlag(useSpeedparcel);
@@ -76,42 +121,39 @@ export async function ensureNeo4jMcp(useSpeedparcel: boolean = false) {
   // If we’re already connected to the right DB, nothing to do.
   if (client && currentTarget === desiredTarget) return;
 
-  // If an init is already in flight, await it first, then re-check.
-  if (initPromise) {
-    await initPromise;
-    if (client && currentTarget === desiredTarget) return;
+  const connection = await getConnection(desiredTarget);
+
+  if (currentTarget && currentTarget !== desiredTarget) {
+    logger.info(`[MCP] Switching DB ${currentTarget} -> ${desiredTarget}`);
   }
 
-  // Start (re)connect; store promise so concurrent callers coalesce
-  initPromise = (async () => {
-    // If connected but to the wrong target → reconnect
-    if (client && currentTarget !== desiredTarget) {
-      console.log(`[MCP] Switching DB ${currentTarget} -> ${desiredTarget}`);
-    } else {
-      console.log(`[MCP] Initializing DB connection: ${desiredTarget}`);
-    }
+  client = connection.client;
+  currentTarget = desiredTarget;
+}
 
-    await connectToTarget(desiredTarget);
-  })();
+// Client for the active DB, reconnecting if its neo4j-mcp process went away
+async function activeClient(): Promise<Client> {
+  if (client) return client;
 
-  try {
-    await initPromise;
-  } finally {
-    initPromise = null;
+  if (!currentTarget) {
+    throw new Error(
+      "Neo4j MCP client not initialized. Call ensureNeo4jMcp() first."
+    );
   }
+
+  const target = currentTarget;
+  const connection = await getConnection(target);
+  if (currentTarget === target) client = connection.client;
+  return connection.client;
 }
 
 export async function readCypher(
   query: string,
   params: Record<string, any> = {}
 ) {
-  if (!client) {
-    throw new Error(
-      "Neo4j MCP client not initialized. Call ensureNeo4jMcp() first."
-    );
-  }
+  const mcpClient = await activeClient();
 
-  const result = await client.request(
+  const result = await mcpClient.request(
     {
       method: "tools/call",
       params: {
@@ -139,13 +181,9 @@ export async function writeCypher(
   query: string,
   params: Record<string, any> = {}
 ) {
-  if (!client) {
-    throw new Error(
-      "Neo4j MCP client not initialized. Call ensureNeo4jMcp() first."
-    );
-  }
+  const mcpClient = await activeClient();
 
-  const result = await client.request(
+  const result = await mcpClient.request(
     {
       method: "tools/call",
       params: {
@@ -169,17 +207,19 @@ export async function writeCypher(
 }
 
 export async function shutdownNeo4jMcp() {
-  if (transport) {
+  const open = [...connections.values()];
+  connections.clear();
+  client = null;
+  currentTarget = null;
+
+  for (const { transport } of open) {
     try {
       await transport.close();
     } catch (e) {
       // ignore close errors; we still want to reset state
     }
   }
-  transport = null;
-  client = null;
-  currentTarget = null;
-  console.log("[MCP] Neo4j MCP transport closed");
+  logger.info("[MCP] Neo4j MCP transport closed");
 }
 
 // Optional helper (useful for debugging / UI)
@@ -74,13 +74,15 @@ export default function summarizeGraphSchema(
   const schemaMap = unwrapApocMetaSchema(apocMetaSchemaRaw);
   const indexRows = unwrapShowIndexes(showIndexesRaw);
 
-  const nodeEntries = Object.entries(schemaMap).filter(
-    ([, v]: any) => v?.type === "node"
-  ) as Array<[string, any]>;
-
-  const relEntries = Object.entries(schemaMap).filter(
-    ([, v]: any) => v?.type === "relationship"
-  ) as Array<[string, any]>;
+  // One pass over the schema map to split labels from relationship types
+  const nodeEntries: Array<[string, any]> = [];
+  const relEntries: Array<[string, any]> = [];
+  for (const [name, info] of Object.entries(schemaMap) as Array<
+    [string, any]
+  >) {
+    if (info?.type === "node") nodeEntries.push([name, info]);
+    else if (info?.type === "relationship") relEntries.push([name, info]);
+  }
 
   const labelsBlock = nodeEntries
     .map(([label, info]) => {
@@ -124,46 +126,23 @@ ${relLines || "  - (none found)"}`;
     .sort()
     .join("\n");
 
-  const vectorIndexes = indexRows
-    .filter((r) =>
-      String(r.type ?? "")
-        .toUpperCase()
-        .includes("VECTOR")
-    )
-    .map((r: any) => {
-      const lot = normalizeList(r.labelsOrTypes).join("|");
-      const props = normalizeList(r.properties).join(", ");
-      return `- ${r.name} on ${lot}(${props})`;
-    });
-
-  const fulltextIndexes = indexRows
-    .filter((r) =>
-      String(r.type ?? "")
-        .toUpperCase()
-        .includes("FULLTEXT")
-    )
-    .map((r: any) => {
-      const lot = normalizeList(r.labelsOrTypes).join("|");
-      const props = normalizeList(r.properties).join(", ");
-      return `- ${r.name} on ${lot}(${props})`;
-    });
-
-  const otherIndexes = indexRows
-    .filter(
-      (r) =>
-        !String(r.type ?? "")
-          .toUpperCase()
-          .includes("VECTOR") &&
-        !String(r.type ?? "")
-          .toUpperCase()
-          .includes("FULLTEXT")
-    )
-    .slice(0, 25)
-    .map((r: any) => {
-      const lot = normalizeList(r.labelsOrTypes).join("|");
-      const props = normalizeList(r.properties).join(", ");
-      return `- ${r.name} [${r.type}] on ${lot}(${props})`;
-    });
+  // One pass over the indexes, upper-casing each type once
+  const vectorIndexes: string[] = [];
+  const fulltextIndexes: string[] = [];
+  const otherIndexes: string[] = [];
+  for (const r of indexRows) {
+    const type = String(r.type ?? "").toUpperCase();
+    const lot = normalizeList(r.labelsOrTypes).join("|");
+    const props = normalizeList(r.properties).join(", ");
+
+    if (type.includes("VECTOR")) {
+      vectorIndexes.push(`- ${r.name} on ${lot}(${props})`);
+    } else if (type.includes("FULLTEXT")) {
+      fulltextIndexes.push(`- ${r.name} on ${lot}(${props})`);
+    } else if (otherIndexes.length < 25) {
+      otherIndexes.push(`- ${r.name} [${r.type}] on ${lot}(${props})`);
+    }
+  }
 
   return `
 Schema summary (from apoc.meta.schema + SHOW INDEXES)
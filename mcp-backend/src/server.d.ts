@@ -1,2 +0,0 @@
-export {};
-//# sourceMappingURL=server.d.ts.map
\ No newline at end of file
@@ -1,19 +1,24 @@
 // src/server.ts
-import express from "express";
+import { createHash } from "node:crypto";
+import express, { type Response } from "express";
 import "dotenv/config";
 import cors from "cors";
 import {
   ensureNeo4jMcp,
   getCurrentDbTarget,
+  preconnectNeo4jMcp,
   readCypher,
   shutdownNeo4jMcp,
   writeCypher,
+  type DbTarget,
 } from "./neo4jMcpClient.js";
 
 import OpenAI from "openai";
 import { importArchiXmlFromNeo4jImportDir } from "./apoc-transpiler/transpile.js";
 import { upload } from "./apoc-transpiler/uploader.js";
 import summarizeGraphSchema from "./schema-helper.js";
+import { LruCache } from "./lru-cache.js";
+import { logger } from "./logger.js";
 
 // Chat history type
 type ChatTurn = {
@@ -21,7 +26,50 @@ type ChatTurn = {
   agent: string;
   updatedAt: number;
 };
-const lastTurnBySession = new Map<string, ChatTurn>();
+// Every browser tab/reset mints a new sessionId, so bound the store (LRU)
+// and let idle sessions expire instead of growing for the process lifetime
+const MAX_SESSIONS = 1000;
+const SESSION_TTL_MS = 30 * 60 * 1000;
+const lastTurnBySession = new LruCache<string, ChatTurn>(MAX_SESSIONS);
+
+function getLastTurn(sessionId: string) {
+  const turn = lastTurnBySession.get(sessionId);
+  if (turn && Date.now() - turn.updatedAt > SESSION_TTL_MS) {
+    lastTurnBySession.delete(sessionId);
+    return undefined;
+  }
+  return turn;
+}
+
+// Async handlers interleave at every await, so two questions in the same
+// session could both read the old turn and the later write would win.
+// Chain them per session: each waits for the previous one (ok or failed).
+const sessionQueues = new Map<string, Promise<unknown>>();
+
+async function withSessionLock<T>(sessionId: string, fn: () => Promise<T>) {
+  const run = (sessionQueues.get(sessionId) ?? Promise.resolve()).then(fn);
+  const tail = run.catch(() => undefined);
+  sessionQueues.set(sessionId, tail);
+
+  try {
+    return await run;
+  } finally {
+    if (sessionQueues.get(sessionId) === tail) sessionQueues.delete(sessionId);
+  }
+}
+
+// Prefix the new question with the previous turn (if any) for follow-ups
+function buildPromptWithContext(prompt: string, lastTurn?: ChatTurn) {
+  if (!lastTurn) return prompt;
+
+  return [
+    "Previous conversation turn:",
+    `User: ${lastTurn.user}`,
+    `Agent: ${lastTurn.agent}`,
+    "",
+    `New user question: ${prompt}`,
+  ].join("\n");
+}
 
 // --------------------
 // OpenAI Client Setup
@@ -30,11 +78,16 @@ const openai = new OpenAI({
   apiKey: process.env.OPENAI_API_KEY,
 });
 
+// Models can be swapped for smaller/faster variants (e.g. "gpt-5-nano")
+const CYPHER_MODEL = process.env.OPENAI_CYPHER_MODEL || "gpt-5";
+const EXPLAIN_MODEL = process.env.OPENAI_EXPLAIN_MODEL || "gpt-4.1";
+
 // --------------------
 // Express Setup
 // --------------------
 const app = express();
 const PORT = process.env.PORT || 4000;
+const DEBUG = logger.isDebugEnabled();
 
 app.use(cors());
 app.use(express.json());
@@ -42,8 +95,7 @@ app.use(express.json());
 // ------------------------------------
 // Helper: generate Cypher using GPT
 // ------------------------------------
-async function nlToCypher(nlPrompt: string, schema: string) {
-  const systemPrompt = `
+const CYPHER_SYSTEM_PROMPT = `
 You are working with a Neo4j graph whose structure is described in the schema summary.
 
 Important rules:
@@ -57,6 +109,11 @@ Index usage based on the schema information passed to you:
 - If the schema summary lists a FULLTEXT index relevant to the task, start with:
   CALL db.index.fulltext.queryNodes("<indexName>", $query, {limit: <k>}) YIELD node, score
   (Do NOT pass a bare integer as the 3rd argument.)
+  $query is bound to the words of the whole question, so use it only for topical searches.
+- To find a specific named element, filter on its name exactly and case-insensitively, e.g.:
+  MATCH (e) WHERE toLower(e.name) = toLower("Customer Portal")
+  (use toLower(...) CONTAINS only when the user gives just part of a name).
+  Do NOT use a FULLTEXT index for named lookups: it splits names into ranked words and truncates results.
 - After any CALL ... YIELD, you MUST finish with a RETURN clause.
   Example: CALL ... YIELD node, score RETURN node, score
 - Otherwise use MATCH with WHERE + indexed properties.
@@ -74,20 +131,24 @@ Cypher syntax rules (important):
 - You MAY start with CALL db.index.fulltext.queryNodes(...) or CALL db.index.vector.queryNodes(...).
 `;
 
+async function nlToCypher(nlPrompt: string, schema: string) {
+  // Schema goes first: system prompt + schema are identical across requests
+  // against the same DB, so OpenAI can serve that prefix from its prompt cache.
   const userPrompt = `
-Natural language request:
-${nlPrompt}
-
 Schema:
 ${schema}
+
+Natural language request:
+${nlPrompt}
 `;
 
   const completion = await openai.chat.completions.create({
-    model: "gpt-5", // or "gpt-5-nano"
+    model: CYPHER_MODEL,
     messages: [
-      { role: "system", content: systemPrompt },
+      { role: "system", content: CYPHER_SYSTEM_PROMPT },
       { role: "user", content: userPrompt },
     ],
+    prompt_cache_key: `nl-to-cypher:${getCurrentDbTarget()}`,
   });
 
   const cypher = completion.choices?.[0]?.message?.content?.trim();
@@ -152,12 +213,7 @@ ${schema}
 // ------------------------------------
 // Helper: explain result in natural language (Markdown)
 // ------------------------------------
-async function explainResult(
-  userPrompt: string,
-  cypher: string,
-  rows: unknown
-) {
-  const systemPrompt = `
+const EXPLAIN_SYSTEM_PROMPT = `
 You are a senior enterprise architect mentoring a junior enterprise architect.
 You are given:
 - The junior's original question.
@@ -177,6 +233,11 @@ Your task:
   - Fenced code blocks for Cypher or JSON snippets when helpful.
 `;
 
+function explainMessages(
+  userPrompt: string,
+  cypher: string,
+  rowsJson: string
+) {
   const userContent = `
 Original question:
 ${userPrompt}
@@ -185,15 +246,28 @@ Executed Cypher:
 ${cypher}
 
 Result rows (JSON):
-${JSON.stringify(rows, null, 2)}
+${rowsJson}
 `;
 
+  return [
+    { role: "system" as const, content: EXPLAIN_SYSTEM_PROMPT },
+    { role: "user" as const, content: userContent },
+  ];
+}
+
+// Both explain paths send the same static system prefix; a shared cache key
+// routes them to the same OpenAI prompt-cache shard
+const EXPLAIN_PROMPT_CACHE_KEY = "explain-result";
+
+async function explainResult(
+  userPrompt: string,
+  cypher: string,
+  rowsJson: string
+) {
   const completion = await openai.chat.completions.create({
-    model: "gpt-4.1",
-    messages: [
-      { role: "system", content: systemPrompt },
-      { role: "user", content: userContent },
-    ],
+    model: EXPLAIN_MODEL,
+    messages: explainMessages(userPrompt, cypher, rowsJson),
+    prompt_cache_key: EXPLAIN_PROMPT_CACHE_KEY,
   });
 
   const answer = completion.choices?.[0]?.message?.content?.trim();
@@ -202,6 +276,395 @@ ${JSON.stringify(rows, null, 2)}
   return answer;
 }
 
+// Same explanation, yielded as the model produces it
+async function* streamExplanation(
+  userPrompt: string,
+  cypher: string,
+  rowsJson: string,
+  signal?: AbortSignal
+) {
+  const stream = await openai.chat.completions.create(
+    {
+      model: EXPLAIN_MODEL,
+      messages: explainMessages(userPrompt, cypher, rowsJson),
+      prompt_cache_key: EXPLAIN_PROMPT_CACHE_KEY,
+      stream: true,
+    },
+    signal ? { signal } : {}
+  );
+
+  for await (const chunk of stream) {
+    const delta = chunk.choices?.[0]?.delta?.content;
+    if (delta) yield delta;
+  }
+}
+
+// ------------------------------------
+// Helper: Server-Sent Events framing
+// ------------------------------------
+// Payloads are JSON-encoded so newlines in Markdown never break a frame
+function openSseStream(res: Response) {
+  res.writeHead(200, {
+    "Content-Type": "text/event-stream",
+    "Cache-Control": "no-cache",
+    Connection: "keep-alive",
+    "X-Accel-Buffering": "no", // don't let a reverse proxy buffer the stream
+  });
+  res.flushHeaders();
+}
+
+// Each frame goes out as one write; Node encodes a string straight into the
+// socket buffer, so building it as a Buffer first would only add a copy
+function sendSseEvent(res: Response, event: string, data: unknown) {
+  const json = JSON.stringify(data);
+  res.write(
+    event === "message"
+      ? `data: ${json}\n\n`
+      : `event: ${event}\ndata: ${json}\n\n`
+  );
+}
+
+// The end-of-answer frame never changes; encode it once
+const SSE_DONE_FRAME = Buffer.from("event: done\ndata: {}\n\n");
+
+// Model deltas are a few characters each; batching them into ~16 ms / 32-char
+// frames cuts socket writes (and UI re-renders) without visible extra latency
+const SSE_FLUSH_CHARS = 32;
+const SSE_FLUSH_MS = 16;
+
+async function* coalesceDeltas(deltas: AsyncIterable<string>) {
+  let buffer = "";
+  let lastFlush = Date.now();
+
+  for await (const delta of deltas) {
+    buffer += delta;
+    if (
+      buffer.length >= SSE_FLUSH_CHARS ||
+      Date.now() - lastFlush >= SSE_FLUSH_MS
+    ) {
+      yield buffer;
+      buffer = "";
+      lastFlush = Date.now();
+    }
+  }
+
+  if (buffer) yield buffer;
+}
+
+// ------------------------------------
+// Helper: schema summary for the active database
+// ------------------------------------
+// Built once per database and refreshed after imports/resets, not on every query
+const schemaSummaryByTarget = new Map<DbTarget, string>();
+
+// Bumped whenever graph data changes; cached results from older versions are stale
+let graphVersion = 0;
+
+// The active DB and its data version at the start of a slow operation.
+// Toggles and imports switch the target globally and may land mid-call, so
+// results are only cached if their snapshot is still current at the end.
+type GraphSnapshot = { target: DbTarget | null; version: number };
+
+function graphSnapshot(): GraphSnapshot {
+  return { target: getCurrentDbTarget(), version: graphVersion };
+}
+
+function isCurrent(snapshot: GraphSnapshot) {
+  return (
+    snapshot.target === getCurrentDbTarget() &&
+    snapshot.version === graphVersion
+  );
+}
+
+async function loadSchemaSummary() {
+  // Independent reads: issue both so their round-trips overlap
+  const [apocSchemaRaw, indexesRaw] = await Promise.all([
+    readCypher(`CALL apoc.meta.schema();`),
+    readCypher(`SHOW INDEXES;`),
+  ]);
+
+  const schemaText = summarizeGraphSchema(apocSchemaRaw, indexesRaw);
+
+  if (logger.isDebugEnabled()) {
+    logger.debug("Apoc schema raw:", JSON.stringify(apocSchemaRaw));
+    logger.debug("Schema summary:\n", schemaText);
+  }
+
+  return schemaText;
+}
+
+// In-flight loads, so concurrent requests on a cold cache share one introspection
+const schemaLoadsByTarget = new Map<DbTarget, Promise<string>>();
+
+async function getSchemaSummary() {
+  const target = getCurrentDbTarget();
+  if (!target) return loadSchemaSummary();
+
+  const cached = schemaSummaryByTarget.get(target);
+  if (cached) return cached;
+
+  const inFlight = schemaLoadsByTarget.get(target);
+  if (inFlight) return inFlight;
+
+  const version = graphVersion;
+  const load = loadSchemaSummary();
+  schemaLoadsByTarget.set(target, load);
+
+  try {
+    const schemaText = await load;
+
+    // Only cache if neither the active DB nor its data changed while loading
+    if (getCurrentDbTarget() === target && graphVersion === version) {
+      schemaSummaryByTarget.set(target, schemaText);
+    }
+
+    return schemaText;
+  } finally {
+    if (schemaLoadsByTarget.get(target) === load) {
+      schemaLoadsByTarget.delete(target);
+    }
+  }
+}
+
+async function refreshSchemaSummary() {
+  const target = getCurrentDbTarget();
+  if (target) {
+    schemaSummaryByTarget.delete(target);
+    schemaLoadsByTarget.delete(target);
+  }
+  await getSchemaSummary();
+}
+
+// ------------------------------------
+// Helper: NL → Cypher → rows, memoized
+// ------------------------------------
+// rowsJson is serialized once (compact: indentation only costs prompt tokens)
+// and reused by the answer cache key and the explain prompt
+type Retrieval = { cypher: string; rows: unknown; rowsJson: string };
+
+// The explainer summarizes; a sample plus the total is enough, and an
+// uncapped result (e.g. "list all elements") would bloat every explain prompt
+const MAX_EXPLAIN_ROWS = 200;
+
+function rowsToPromptJson(rows: unknown) {
+  if (!Array.isArray(rows) || rows.length <= MAX_EXPLAIN_ROWS) {
+    return JSON.stringify(rows);
+  }
+
+  return `${JSON.stringify(rows.slice(0, MAX_EXPLAIN_ROWS))}
+(showing the first ${MAX_EXPLAIN_ROWS} of ${rows.length} rows)`;
+}
+
+// Words of the prompt for a Lucene OR query. The raw prompt can't be passed as-is:
+// "?", ":", "(" etc. are Lucene syntax and make ordinary questions fail to parse.
+const FULLTEXT_TOKEN_RE = /[\p{L}\p{N}]{2,}/gu;
+const LUCENE_SPECIAL_RE = /[+\-&|!(){}[\]^"~*?:\\/]/g;
+
+function toFulltextQuery(text: string) {
+  const tokens = [...new Set(text.toLowerCase().match(FULLTEXT_TOKEN_RE))];
+  if (tokens.length) return tokens.join(" OR ");
+  return text.replace(LUCENE_SPECIAL_RE, "\\$&");
+}
+
+// Recently answered prompts, so retries skip both the LLM and Neo4j.
+// Keys include graphVersion, so imports/resets invalidate everything older.
+const retrievalCache = new LruCache<string, Retrieval>(256);
+
+// Whitespace-insensitive hash, so retyped questions hit and keys stay small.
+// Case is kept: the LLM copies names into case-sensitive Cypher comparisons,
+// so "statmanplus" and "StatManPlus" can yield different queries and rows.
+function normalizedHash(text: string) {
+  const normalized = text.trim().replace(/\s+/g, " ");
+  return createHash("sha1").update(normalized).digest("hex");
+}
+
+// Identical questions in flight at the same time share one LLM + Neo4j run
+const retrievalsInFlight = new Map<string, Promise<Retrieval>>();
+
+// Cypher generated from one DB's schema must not run against another
+function assertSameTarget(snapshot: GraphSnapshot) {
+  if (getCurrentDbTarget() !== snapshot.target) {
+    throw new Error(
+      "The active database changed while answering. Please ask again."
+    );
+  }
+}
+
+async function runRetrieval(
+  prompt: string,
+  promptWithContext: string,
+  snapshot: GraphSnapshot
+): Promise<Retrieval> {
+  // 1) Fetch schema summary (cached per database)
+  const schemaText = await getSchemaSummary();
+  assertSameTarget(snapshot);
+
+  // 2) Convert NL → initial Cypher
+  const cypher = await nlToCypher(promptWithContext, schemaText);
+  assertSameTarget(snapshot);
+
+  // 3) Execute Cypher via MCP
+  const cypherParams: Record<string, any> = {};
+
+  if (/\$query\b/.test(cypher)) {
+    cypherParams.query = toFulltextQuery(prompt);
+  }
+
+  const rows: unknown = await readCypher(cypher, cypherParams);
+
+  return { cypher, rows, rowsJson: rowsToPromptJson(rows) };
+}
+
+async function retrieve(
+  prompt: string,
+  promptWithContext: string
+): Promise<Retrieval> {
+  const snapshot = graphSnapshot();
+  const key = `${snapshot.target}:${snapshot.version}:${normalizedHash(
+    promptWithContext
+  )}`;
+  const cached = retrievalCache.get(key);
+  if (cached) return cached;
+
+  const inFlight = retrievalsInFlight.get(key);
+  if (inFlight) return inFlight;
+
+  const run = runRetrieval(prompt, promptWithContext, snapshot);
+  retrievalsInFlight.set(key, run);
+
+  try {
+    const result = await run;
+
+    // An empty result usually means the generated Cypher missed; don't cache
+    // it, so asking again gets a fresh Cypher attempt
+    const empty = Array.isArray(result.rows) && result.rows.length === 0;
+    if (!empty && isCurrent(snapshot)) retrievalCache.set(key, result);
+    return result;
+  } finally {
+    retrievalsInFlight.delete(key);
+  }
+}
+
+// ------------------------------------
+// Helper: explanation cache
+// ------------------------------------
+// The same question (incl. the previous turn) over the same rows gets the
+// same explanation; repeats skip the second LLM call entirely
+const answerCache = new LruCache<string, string>(256);
+
+function answerKey(
+  promptWithContext: string,
+  cypher: string,
+  rowsJson: string
+) {
+  return createHash("sha1")
+    .update(
+      [
+        EXPLAIN_MODEL,
+        normalizedHash(promptWithContext),
+        cypher,
+        rowsJson,
+      ].join("\0")
+    )
+    .digest("hex");
+}
+
+// ------------------------------------
+// Helper: answer one question of a session
+// ------------------------------------
+type TurnOptions = {
+  signal?: AbortSignal; // cancels the turn (e.g. the client disconnected)
+  onCypher?: (cypher: string) => void; // called once the query is known
+  onDelta?: (delta: string) => void; // set to stream the explanation
+};
+
+function saveTurn(sessionId: string, prompt: string, answer: string) {
+  lastTurnBySession.set(sessionId, {
+    user: prompt, // store the raw new question (not promptWithContext)
+    agent: answer, // store the final response
+    updatedAt: Date.now(),
+  });
+}
+
+async function answerTurn(
+  sessionId: string,
+  prompt: string,
+  { signal, onCypher, onDelta }: TurnOptions = {}
+) {
+  // The whole turn runs under the session lock so a follow-up sees this answer
+  return withSessionLock(sessionId, async () => {
+    signal?.throwIfAborted(); // client left while queued
+
+    const promptWithContext = buildPromptWithContext(
+      prompt,
+      getLastTurn(sessionId)
+    );
+
+    // 1-3) Schema → NL → Cypher → rows (memoized per database/prompt)
+    const snapshot = graphSnapshot();
+    const { cypher, rows, rowsJson } = await retrieve(
+      prompt,
+      promptWithContext
+    );
+    signal?.throwIfAborted(); // client left during retrieval
+    onCypher?.(cypher);
+
+    // 4) Turn result into a natural-language explanation (memoized)
+    const key = answerKey(promptWithContext, cypher, rowsJson);
+    let answer = answerCache.get(key);
+
+    if (answer) {
+      onDelta?.(answer);
+    } else if (!onDelta) {
+      answer = await explainResult(promptWithContext, cypher, rowsJson);
+    } else {
+      let streamed = "";
+      try {
+        const deltas = streamExplanation(
+          promptWithContext,
+          cypher,
+          rowsJson,
+          signal
+        );
+        for await (const delta of coalesceDeltas(deltas)) {
+          streamed += delta;
+          onDelta(delta);
+        }
+        signal?.throwIfAborted();
+      } catch (err) {
+        // The user hit Stop: the UI keeps the partial reply, so keep it as
+        // context too. After an upstream error the UI shows the error instead.
+        if (signal?.aborted && streamed.trim()) {
+          saveTurn(sessionId, prompt, streamed.trim());
+        }
+        throw err;
+      }
+      answer = streamed.trim();
+    }
+
+    // Only complete answers are cached (and only if the DB didn't change
+    // under them) and saved
+    if (answer) {
+      if (isCurrent(snapshot)) answerCache.set(key, answer);
+      saveTurn(sessionId, prompt, answer);
+    }
+
+    return { answer, cypher, rows };
+  });
+}
+
+// Call after the active database's data changed (import, reset). The schema
+// reload is best-effort: its failure must not fail a write that already happened
+function onGraphDataChanged() {
+  graphVersion++;
+  retrievalCache.clear();
+  answerCache.clear();
+  retrievalsInFlight.clear();
+  refreshSchemaSummary().catch((err) =>
+    logger.error("[SCHEMA] Failed to refresh schema summary:", err)
+  );
+}
+
 export async function resetPlaygroundGraphDatabase() {
   await ensureNeo4jMcp(false);
 
@@ -209,6 +672,8 @@ export async function resetPlaygroundGraphDatabase() {
     throw new Error("Refusing to reset DB because target is not 'playground'.");
   }
 
+  // Delete in bounded batches so each round-trip stays a small transaction
+  const batchSize = 10000;
   const batchQuery = `
     MATCH (n)
     WHERE NOT (
@@ -218,33 +683,44 @@ export async function resetPlaygroundGraphDatabase() {
       n:Embedding OR
       n:Section
     )
-    DETACH DELETE n;
+    WITH n LIMIT ${batchSize}
+    DETACH DELETE n
+    RETURN count(*) AS deleted;
   `;
 
   let total = 0;
   const maxBatches = 100000; // safety guard
 
-  for (let i = 0; i < maxBatches; i++) {
-    const rows = await writeCypher(batchQuery);
-
-    // MCP returns rows as JSON (array). Expect: [{ deleted: <number> }]
-    const deleted = Array.isArray(rows) ? Number(rows?.[0]?.deleted ?? 0) : 0;
-
-    total += deleted;
-
-    if (deleted === 0) {
-      console.log(`[RESET] Done. Total deleted: ${total}`);
-      return { ok: true, deleted: total };
+  try {
+    for (let i = 0; i < maxBatches; i++) {
+      const rows = await writeCypher(batchQuery);
+
+      // MCP returns rows as JSON (array). Expect: [{ deleted: <number> }]
+      const deleted = Array.isArray(rows)
+        ? Number(rows?.[0]?.deleted ?? 0)
+        : 0;
+
+      total += deleted;
+
+      if (deleted === 0) {
+        logger.info(`[RESET] Done. Total deleted: ${total}`);
+        return { ok: true, deleted: total };
+      }
+
+      if (i % 10 === 0) {
+        logger.debug(
+          `[RESET] Batch ${i + 1}: deleted ${deleted}, total ${total}`
+        );
+      }
     }
 
-    if (i % 10 === 0) {
-      console.log(`[RESET] Batch ${i + 1}: deleted ${deleted}, total ${total}`);
-    }
+    throw new Error(
+      `[RESET] Aborted after ${maxBatches} batches (deleted so far: ${total}).`
+    );
+  } finally {
+    // Earlier batches may have committed even if a later one failed
+    onGraphDataChanged();
   }
-
-  throw new Error(
-    `[RESET] Aborted after ${maxBatches} batches (deleted so far: ${total}).`
-  );
 }
 
 // ------------------------------------
@@ -269,56 +745,74 @@ app.post("/api/neo4j/query", async (req, res) => {
       return res.status(400).json({ error: "Missing sessionId or prompt" });
     }
 
-    const lastTurn = lastTurnBySession.get(sessionId);
-
-    const promptWithContext = lastTurn
-      ? `Previous conversation turn:
-          User: ${lastTurn.user}
-          Agent: ${lastTurn.agent}
-
-          New user question: ${prompt}`
-      : prompt;
-
-    // 1) Fetch schema dynamically from MCP server (can be cached)
-    const apocSchemaRaw = await readCypher(`CALL apoc.meta.schema();`);
-    const indexesRaw = await readCypher(`SHOW INDEXES;`);
-
-    console.log("Apoc schema raw:", JSON.stringify(apocSchemaRaw));
+    const { answer, cypher, rows } = await answerTurn(sessionId, prompt);
 
-    const schemaText = summarizeGraphSchema(apocSchemaRaw, indexesRaw);
-    console.log("Schema summary:\n", schemaText);
-
-    // 2) Convert NL → initial Cypher
-
-    let cypher = await nlToCypher(promptWithContext, schemaText);
-
-    // 3) Execute Cypher via MCP
-    const cypherParams: Record<string, any> = {};
+    // 5) Send answer (plus debug info) back to frontend
+    res.json({
+      answer, // natural-language EA explanation (Markdown)
+      cypher, // final Cypher used
+      // final rows (may be empty); the UI doesn't render them, so only in debug
+      ...(DEBUG ? { rows } : {}),
+    });
+  } catch (err: any) {
+    logger.error("[API] Error in /api/neo4j/query:", err);
+    res.status(500).json({ error: err.message ?? "Internal server error" });
+  }
+});
 
-    if (/\$query\b/.test(cypher)) {
-      cypherParams.query = prompt;
-    }
+// ------------------------------------
+// POST /api/neo4j/query/stream
+// Same body as /api/neo4j/query; the answer arrives as Server-Sent Events:
+//   event: meta   { cypher }
+//   (message)     { delta }   Markdown chunks, in order
+//   event: done   {}
+//   event: error  { error }
+// ------------------------------------
+app.post("/api/neo4j/query/stream", async (req, res) => {
+  const { prompt, sessionId } = req.body as {
+    prompt?: string;
+    sessionId?: string;
+  };
+
+  if (!sessionId || !prompt) {
+    return res.status(400).json({ error: "Missing sessionId or prompt" });
+  }
 
-    let rows: unknown = await readCypher(cypher, cypherParams);
+  openSseStream(res);
 
-    // 4) Turn result into a natural-language explanation
-    const answer = await explainResult(promptWithContext, cypher, rows);
+  // Stop the upstream completion as soon as the client goes away
+  const upstream = new AbortController();
+  res.on("close", () => upstream.abort());
 
-    // Save the last turn in context
-    lastTurnBySession.set(sessionId, {
-      user: prompt, // store the raw new question (not promptWithContext)
-      agent: answer, // store the final response
-      updatedAt: Date.now(),
+  try {
+    await answerTurn(sessionId, prompt, {
+      signal: upstream.signal,
+      onCypher: (cypher) => sendSseEvent(res, "meta", { cypher }),
+      onDelta: (delta) => sendSseEvent(res, "message", { delta }),
     });
+    res.write(SSE_DONE_FRAME);
+  } catch (err: any) {
+    if (!upstream.signal.aborted) {
+      logger.error("[API] Error in /api/neo4j/query/stream:", err);
+      sendSseEvent(res, "error", {
+        error: err.message ?? "Internal server error",
+      });
+    }
+  } finally {
+    res.end();
+  }
+});
 
-    // 5) Send answer (plus debug info) back to frontend
-    res.json({
-      answer, // natural-language EA explanation (Markdown)
-      cypher, // final Cypher used
-      rows, // final rows (may be empty)
-    });
+// ------------------------------------
+// GET /api/neo4j/schema
+// Returns the cached schema summary (labels, relationships, indexes) of the active DB
+// ------------------------------------
+app.get("/api/neo4j/schema", async (_req, res) => {
+  try {
+    const schema = await getSchemaSummary();
+    res.json({ active: getCurrentDbTarget(), schema });
   } catch (err: any) {
-    console.error("[API] Error in /api/neo4j/query:", err);
+    logger.error("[API] Error in /api/neo4j/schema:", err);
     res.status(500).json({ error: err.message ?? "Internal server error" });
   }
 });
@@ -339,9 +833,14 @@ app.post("/api/neo4j/togglespeedparcel", async (req, res) => {
 
     await ensureNeo4jMcp(use_speedparcel);
 
+    // Warm the schema cache in the background so the first question is fast
+    getSchemaSummary().catch((err) =>
+      logger.error("[SCHEMA] Failed to warm schema summary:", err)
+    );
+
     res.json({ status: "ok", use_speedparcel, active: getCurrentDbTarget() });
   } catch (err: any) {
-    console.error("[API] Error in /api/neo4j/togglespeedparcel:", err);
+    logger.error("[API] Error in /api/neo4j/togglespeedparcel:", err);
     res.status(500).json({ error: err.message ?? "Internal server error" });
   }
 });
@@ -353,7 +852,7 @@ app.post("/api/admin/reset-graph", async (_req, res) => {
 
     res.status(200).json({ success: true });
   } catch (e) {
-    console.log("Error during graph reset: ", e);
+    logger.error("Error during graph reset: ", e);
     res.status(500).json({ success: false, error: String(e) });
   }
 });
@@ -372,10 +871,15 @@ app.post("/api/admin/add-data", upload.array("files", 10), async (req, res) => {
 
     // Import each uploaded file
     const results = [];
-    for (const f of files) {
-      // Important: pass ONLY the filename; Neo4j reads it via file:///data/<name>.xml
-      const r = await importArchiXmlFromNeo4jImportDir(f.filename);
-      results.push({ file: f.filename, result: r });
+    try {
+      for (const f of files) {
+        // Important: pass ONLY the filename; Neo4j reads it via file:///data/<name>.xml
+        const r = await importArchiXmlFromNeo4jImportDir(f.filename);
+        results.push({ file: f.filename, result: r });
+      }
+    } finally {
+      // Files imported before a failure are already in the graph
+      onGraphDataChanged();
     }
 
     res.status(200).json({ success: true, results });
@@ -388,10 +892,23 @@ app.post("/api/admin/add-data", upload.array("files", 10), async (req, res) => {
 // Start server (no DB init here)
 // ------------------------------------
 async function start() {
-  await ensureNeo4jMcp(); // default to SpeedParcel on startup
+  await ensureNeo4jMcp(); // default to the playground on startup
+
+  // Open SpeedParcel too, so the first toggle doesn't wait for neo4j-mcp to start.
+  // In the background: a missing or slow SpeedParcel must not hold up startup.
+  preconnectNeo4jMcp(true).catch((err) =>
+    logger.warn("[MCP] Could not pre-connect to SpeedParcel:", err)
+  );
+
+  // Introspect once up front instead of on the first user question
+  try {
+    await getSchemaSummary();
+  } catch (err) {
+    logger.error("[SCHEMA] Failed to load schema summary on startup:", err);
+  }
 
   app.listen(PORT, () => {
-    console.log(`Server listening on http://localhost:${PORT}`);
+    logger.info(`Server listening on http://localhost:${PORT}`);
   });
 }
 
@@ -399,18 +916,18 @@ async function start() {
 // Graceful shutdown
 // ------------------------------------
 process.on("SIGINT", async () => {
-  console.log("Received SIGINT. Shutting down...");
+  logger.info("Received SIGINT. Shutting down...");
   await shutdownNeo4jMcp();
   process.exit(0);
 });
 
 process.on("SIGTERM", async () => {
-  console.log("Received SIGTERM. Shutting down...");
+  logger.info("Received SIGTERM. Shutting down...");
   await shutdownNeo4jMcp();
   process.exit(0);
 });
 
 start().catch((err) => {
-  console.error("Failed to start server:", err);
+  logger.error("Failed to start server:", err);
   process.exit(1);
 });